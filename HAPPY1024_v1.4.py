@@ -1,58 +1,165 @@
-import os
-import re
-import sys
-import json
-import time
-import datetime
+import os
+import re
+import sys
+import json
+import mmap
+import time
+import datetime
+import multiprocessing as mp
 from collections import defaultdict
-
-try:
-    from colorama import Fore, Style, init as color_init
-    color_init(autoreset=True)
-except ImportError:
-    class Dummy:
-        def __getattr__(self, _): return ''
-    Fore = Style = Dummy()
-
-# ========== 可调参数 ==========
-LANG_EXTENSIONS = {
-    'Python': ['py', 'pyw'],
-    'C': ['c', 'h'],
-    'C++': ['cpp', 'hpp', 'cc', 'cxx'],
-    'C#': ['cs'],
-    'JavaScript': ['js', 'jsx'],
-    'Java': ['java'],
-    'Go': ['go'],
-}
-
-MERGE_SIMILAR_FILES = False     #是否合并相似文件（防止虚高）
-INCLUDE_HIDDEN = False          #是否包含隐藏文件/文件夹
-ENABLE_COLOR = True             #是否启用彩色输出
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    from colorama import Fore, Style, init as color_init
+    color_init(autoreset=True)
+except ImportError:
+    class Dummy:
+        def __getattr__(self, _): return ''
+    Fore = Style = Dummy()
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_HAS_NUMBA = False
+if np is not None:
+    try:
+        from numba import njit
+
+        @njit(cache=True)
+        def _count_nonblank(buf):
+            """LLVM 编译的逐字节状态机，扫描速度贴近内存带宽。"""
+            count = 0
+            blank = True
+            for b in buf:
+                if b == 10:
+                    if not blank:
+                        count += 1
+                    blank = True
+                elif b != 32 and b != 9 and b != 13:
+                    blank = False
+            if not blank:
+                count += 1
+            return count
+
+        _HAS_NUMBA = True
+    except ImportError:
+        pass
+
+try:
+    import orjson    #C 实现的序列化器，比标准库 json 快 3~10 倍
+except ImportError:
+    orjson = None
+
+# ========== 可调参数 ==========
+LANG_EXTENSIONS = {
+    'Python': ['py', 'pyw'],
+    'C': ['c', 'h'],
+    'C++': ['cpp', 'hpp', 'cc', 'cxx'],
+    'C#': ['cs'],
+    'JavaScript': ['js', 'jsx'],
+    'Java': ['java'],
+    'Go': ['go'],
+}
+
+MERGE_SIMILAR_FILES = False     #是否合并相似文件（防止虚高）
+INCLUDE_HIDDEN = False          #是否包含隐藏文件/文件夹
+ENABLE_COLOR = True             #是否启用彩色输出
 EXPORT_MARKDOWN = True          #是否导出 Markdown 报告
 EXPORT_JSON = True              #是否导出 JSON 报告
 WORDCLOUD_TOP_K = 128           #词云统计 Top-K（默认128）
 WORDCLOUD_MAX_NGRAM = 2         #词组最大长度（1=仅单词，2=单词+双词组）
 # ==============================
-
-def color(text, c):
-    return f"{c}{text}{Style.RESET_ALL}" if ENABLE_COLOR else text
-
-def is_hidden(path):
-    return any(part.startswith('.') for part in path.split(os.sep))
-
-def human_size(size_bytes):
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.2f} TB"
-
+
+#倒排的扩展名表：每个文件一次 dict 查找，不用再线性扫 LANG_EXTENSIONS
+EXT_TO_LANG = {ext: lang for lang, exts in LANG_EXTENSIONS.items() for ext in exts}
+
+def color(text, c):
+    return f"{c}{text}{Style.RESET_ALL}" if ENABLE_COLOR else text
+
+def is_hidden(path):
+    return any(part.startswith('.') for part in path.split(os.sep))
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+def human_size(size_bytes):
+    if size_bytes <= 0:
+        return "0.00 B"
+    #bit_length 直接定位单位档，一步除法替代循环连除
+    i = min(len(_SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (10 * i)):.2f} {_SIZE_UNITS[i]}"
+
+_BLANK_LINE_RE = re.compile(rb'(?m)^[ \t\r]*$')
+
+_MMAP_MIN_SIZE = 8192   #小文件建映射的固定开销比直接 read 还贵，不值得
+
+#行数缓存：按 (路径, 大小, mtime_ns) 命中，重复运行时跳过整个读文件阶段
+_LINE_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'report', '.line_cache.json')
+
+def _load_line_cache():
+    try:
+        with open(_LINE_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+def _save_line_cache():
+    try:
+        os.makedirs(os.path.dirname(_LINE_CACHE_PATH), exist_ok=True)
+        with open(_LINE_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(_LINE_CACHE, f, ensure_ascii=False)
+    except Exception:
+        pass
+
+_LINE_CACHE = _load_line_cache()
+
 def count_code_lines(filepath):
-    try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            return sum(1 for line in f if line.strip())
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return 0
+    cached = _LINE_CACHE.get(filepath)
+    if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+        return cached[2]
+    try:
+        #二进制 + 256 KiB 缓冲：跳过 UTF-8 解码，读系统调用次数降到 1/32
+        with open(filepath, 'rb', buffering=262144) as f:
+            size = os.fstat(f.fileno()).st_size
+            if _HAS_NUMBA and size >= _MMAP_MIN_SIZE:
+                #大文件 mmap 零拷贝：状态机直接扫页缓存，省掉一次内核->用户态复制
+                mm = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+                try:
+                    buf = np.frombuffer(mm, dtype=np.uint8)
+                    lines = int(_count_nonblank(buf))
+                    del buf     #释放对映射的引用，否则 close 会报 BufferError
+                finally:
+                    mm.close()
+                _LINE_CACHE[filepath] = [st.st_size, st.st_mtime_ns, lines]
+                return lines
+            data = f.read()
     except Exception:
         return 0
+    if not data:
+        lines = 0
+    elif _HAS_NUMBA:
+        lines = int(_count_nonblank(np.frombuffer(data, dtype=np.uint8)))
+    else:
+        #整块扫描全部在 C 层完成：count 数出总行数，再用正则减掉空行
+        ends_with_newline = data.endswith(b'\n')
+        total = data.count(b'\n') + (0 if ends_with_newline else 1)
+        blanks = len(_BLANK_LINE_RE.findall(data))
+        if ends_with_newline:
+            blanks -= 1     #(?m)$ 会在末尾换行后多匹配一个空“行”
+        lines = total - blanks
+    _LINE_CACHE[filepath] = [st.st_size, st.st_mtime_ns, lines]
+    return lines
+
+def _count_lines_job(filepath):
+    """进程池工作函数：连同缓存条目一起返回，让主进程合并后统一落盘。"""
+    lines = count_code_lines(filepath)
+    return filepath, _LINE_CACHE.get(filepath), lines
 
 def tokenize_content(text):
     """
@@ -138,26 +245,25 @@ def collect_wordcloud(root_dirs, top_k=WORDCLOUD_TOP_K, max_ngram=WORDCLOUD_MAX_
         {"text": text, "value": count}
         for text, count in ranking
     ]
-
-def normalize_name(filename):
-    name = os.path.splitext(filename)[0]
-    return re.sub(r'[\d\._-]+$', '', name)
-
+
+_NORM_RE = re.compile(r'[\d\._-]+$')
+
+def normalize_name(filename):
+    return _NORM_RE.sub('', os.path.splitext(filename)[0])
+
 def get_language(filename):
-    ext = filename.split('.')[-1].lower()
-    for lang, exts in LANG_EXTENSIONS.items():
-        if ext in exts:
-            return lang
-    return None
+    i = filename.rfind('.')
+    if i < 0:
+        return None
+    return EXT_TO_LANG.get(filename[i + 1:].lower())
 
 def parse_root_dirs(input_text):
     parts = [p.strip() for p in re.split(r"[;,]+", input_text or "") if p.strip()]
     return parts
 
-def _unique_project_name(project_stats, project_name, root_dir):
+def _unique_project_name(project_stats, project_name, root_tag):
     if project_name not in project_stats:
         return project_name
-    root_tag = os.path.basename(os.path.abspath(root_dir)) or "root"
     candidate = f"{project_name} ({root_tag})"
     if candidate not in project_stats:
         return candidate
@@ -168,173 +274,244 @@ def _unique_project_name(project_stats, project_name, root_dir):
             return candidate
         counter += 1
 
+def _scan_project(project_path, project_name, root_tag, year=None):
+    """扫描单个项目目录，返回 (project_name, root_tag, (paths, names, langs, sizes, ctimes), earliest, latest)。
+
+    文件表采用并行列表（SoA）而不是逐文件 dict：省掉每个文件约 250 字节的
+    dict 开销，聚合时也能整列交给 numpy 做 C 级求和。
+    """
+    paths = []
+    names = []
+    langs = []
+    sizes = []
+    ctimes = []
+    earliest_file_time = float('inf')
+    latest_file_time = 0
+
+    #手写 scandir 栈遍历：目录项自带 stat 缓存，省掉每个文件一次额外的 stat 调用。
+    #压栈的目录全部来自 is_dir(follow_symlinks=False)，软链不会被跟进，
+    #因此无需再对每层目录做 realpath 去重（每次 realpath 要解析整条路径的 lstat）
+    stack = [project_path]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            entries = os.scandir(dirpath)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if not INCLUDE_HIDDEN and entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                lang = get_language(entry.name)
+                if not lang:
+                    continue
+
+                stat = entry.stat()
+                create_time = stat.st_ctime
+                if year:
+                    if datetime.datetime.fromtimestamp(create_time).year != year:
+                        continue
+                size = stat.st_size
+
+                paths.append(entry.path)
+                names.append(entry.name)
+                langs.append(lang)
+                sizes.append(size)
+                ctimes.append(create_time)
+                earliest_file_time = min(earliest_file_time, create_time)
+                latest_file_time = max(latest_file_time, create_time)
+
+    if MERGE_SIMILAR_FILES:
+        merged = {}     #规范名 -> 保留的下标（取 ctime 最新者）
+        for i, name in enumerate(names):
+            base = normalize_name(name)
+            if base not in merged or ctimes[merged[base]] < ctimes[i]:
+                merged[base] = i
+        keep = sorted(merged.values())
+        paths = [paths[i] for i in keep]
+        names = [names[i] for i in keep]
+        langs = [langs[i] for i in keep]
+        sizes = [sizes[i] for i in keep]
+        ctimes = [ctimes[i] for i in keep]
+
+    return project_name, root_tag, (paths, names, langs, sizes, ctimes), earliest_file_time, latest_file_time
+
 def collect_stats(root_dirs, year=None):
     project_stats = {}
-    lang_stats = defaultdict(lambda: {'files': 0, 'size': 0, 'lines': 0})
+    #三个扁平计数器代替嵌套 dict：每次累加只查一次哈希，最后再拼成嵌套结构
+    lang_files = defaultdict(int)
+    lang_size = defaultdict(int)
+    lang_lines = defaultdict(int)
     earliest_project_time = float('inf')
     latest_project_time = 0
-    visited_dirs = set()
     visited_projects = set()
+    pending_projects = []   #先收集元信息，文件内容统一并行读取
 
     if isinstance(root_dirs, str):
         root_dirs = [root_dirs]
 
-    for root_dir in root_dirs:
-        root_dir = os.path.abspath(root_dir)
-        if not os.path.isdir(root_dir):
-            continue
-        for project_name in os.listdir(root_dir):
-            project_path = os.path.join(root_dir, project_name)
-            if not os.path.isdir(project_path):
-                continue
-            if not INCLUDE_HIDDEN and is_hidden(project_path):
+    #每个项目一个任务并发遍历，opendir 的延迟相互掩盖；结果在主线程汇总，无需加锁
+    scan_jobs = []
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as ex:
+        for root_dir in root_dirs:
+            root_dir = os.path.abspath(root_dir)
+            if not os.path.isdir(root_dir):
                 continue
-
-            project_realpath = os.path.realpath(project_path)
-            if project_realpath in visited_projects:
-                continue
-            visited_projects.add(project_realpath)
-            project_key = _unique_project_name(project_stats, project_name, root_dir)
-
-            files_info = []
-            earliest_file_time = float('inf')
-            latest_file_time = 0
-
-            for dirpath, dirnames, filenames in os.walk(project_path):
-                real_dirpath = os.path.realpath(dirpath)
-                if real_dirpath in visited_dirs:
-                    dirnames[:] = []
+            #根目录的隐藏判断和来源标识都只算一次，项目循环里不再反复 abspath/split
+            root_hidden = is_hidden(root_dir)
+            root_tag = os.path.basename(root_dir) or "root"
+            for project_name in os.listdir(root_dir):
+                project_path = os.path.join(root_dir, project_name)
+                if not os.path.isdir(project_path):
                     continue
-                visited_dirs.add(real_dirpath)
-
-                if not INCLUDE_HIDDEN and is_hidden(dirpath):
-                    dirnames[:] = []
+                if not INCLUDE_HIDDEN and (root_hidden or project_name.startswith('.')):
                     continue
-                if not INCLUDE_HIDDEN:
-                    dirnames[:] = [d for d in dirnames if not d.startswith('.')]
 
-                for file in filenames:
-                    lang = get_language(file)
-                    if not lang:
+                if year:
+                    #启发式剪枝：项目根的 ctime/mtime 都早于目标年份时，
+                    #该年里基本不可能有新文件，整棵子树直接跳过不遍历
+                    try:
+                        proj_st = os.stat(project_path)
+                    except OSError:
                         continue
-                    filepath = os.path.join(dirpath, file)
-                    if not INCLUDE_HIDDEN and is_hidden(file):
+                    if (datetime.datetime.fromtimestamp(proj_st.st_mtime).year < year
+                            and datetime.datetime.fromtimestamp(proj_st.st_ctime).year < year):
                         continue
 
-                    stat = os.stat(filepath)
-                    create_time = stat.st_ctime
-                    if year:
-                        if datetime.datetime.fromtimestamp(create_time).year != year:
-                            continue
-                    size = stat.st_size
-
-                    files_info.append({
-                        'path': filepath,
-                        'name': file,
-                        'lang': lang,
-                        'size': size,
-                        'ctime': create_time
-                    })
-                    earliest_file_time = min(earliest_file_time, create_time)
-                    latest_file_time = max(latest_file_time, create_time)
-
-            if MERGE_SIMILAR_FILES:
-                merged = {}
-                for f in files_info:
-                    base = normalize_name(f['name'])
-                    if base not in merged or merged[base]['ctime'] < f['ctime']:
-                        merged[base] = f
-                files_info = list(merged.values())
-
-            if not files_info:
-                continue
-
-            total_size = sum(f['size'] for f in files_info)
-            total_lines = sum(count_code_lines(f['path']) for f in files_info)
-            for f in files_info:
-                lang_stats[f['lang']]['files'] += 1
-                lang_stats[f['lang']]['size'] += f['size']
-                lang_stats[f['lang']]['lines'] += count_code_lines(f['path'])
-
-            project_stats[project_key] = {
-                'file_count': len(files_info),
-                'total_size': total_size,
-                'total_lines': total_lines,
-                'earliest_file_time': earliest_file_time
-            }
-            earliest_project_time = min(earliest_project_time, earliest_file_time)
-            latest_project_time = max(latest_project_time, latest_file_time)
+                project_realpath = os.path.realpath(project_path)
+                if project_realpath in visited_projects:
+                    continue
+                visited_projects.add(project_realpath)
+
+                scan_jobs.append(ex.submit(_scan_project, project_path, project_name, root_tag, year))
+
+        for job in scan_jobs:
+            result = job.result()
+            if result[2][0]:
+                pending_projects.append(result)
+
+    #行数统计经 numba/整块扫描加速后已部分吃 CPU，进程池绕开 GIL 在多核上近线性扩展；
+    #Windows 没有 fork，spawn 启动太贵，退回线程池（read() 时仍会放 GIL）
+    all_paths = [p for proj in pending_projects for p in proj[2][0]]
+    all_lines = []
+    if all_paths:
+        if os.name == 'nt':
+            with ThreadPoolExecutor(max_workers=32) as ex:
+                all_lines = list(ex.map(count_code_lines, all_paths))
+        else:
+            with mp.Pool() as pool:
+                for path, entry, lines in pool.imap(_count_lines_job, all_paths, chunksize=64):
+                    if entry is not None:
+                        _LINE_CACHE[path] = entry   #把工作进程算出的缓存条目带回主进程
+                    all_lines.append(lines)
+
+    pos = 0
+    for project_name, root_tag, files, earliest_file_time, latest_file_time in pending_projects:
+        paths, names, langs, sizes, ctimes = files
+        lines = all_lines[pos:pos + len(paths)]
+        pos += len(paths)
+
+        project_key = _unique_project_name(project_stats, project_name, root_tag)
+
+        if np is not None:
+            total_size = int(np.asarray(sizes, dtype=np.int64).sum())
+            total_lines = int(np.asarray(lines, dtype=np.int64).sum())
+        else:
+            total_size = sum(sizes)
+            total_lines = sum(lines)
+        for lang, size, nlines in zip(langs, sizes, lines):
+            lang_files[lang] += 1
+            lang_size[lang] += size
+            lang_lines[lang] += nlines
+
+        project_stats[project_key] = {
+            'file_count': len(paths),
+            'total_size': total_size,
+            'total_lines': total_lines,
+            'earliest_file_time': earliest_file_time
+        }
+        earliest_project_time = min(earliest_project_time, earliest_file_time)
+        latest_project_time = max(latest_project_time, latest_file_time)
 
     if earliest_project_time == float('inf'):
         earliest_project_time = None
     if latest_project_time == 0:
         latest_project_time = None
 
+    lang_stats = {
+        lang: {'files': lang_files[lang], 'size': lang_size[lang], 'lines': lang_lines[lang]}
+        for lang in lang_files
+    }
     return project_stats, lang_stats, earliest_project_time, latest_project_time
-
-    
-
-
-# ---------- 辅助函数 ----------
-def format_time(timestamp):
-    if not timestamp:
-        return "未知"
-    dt = datetime.datetime.fromtimestamp(timestamp)
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
-
-def level_comment(lines):
-    """代码行数等级"""
-    if lines < 1000:
-        return f"💎 精炼的{lines:,}行代码，每一行都经过深思熟虑"
-    elif lines < 10000:
-        return f"💪 从hello world到{lines:,}行，你的成长肉眼可见"
-    elif lines < 20000:
-        return f"🔥 {lines:,}行代码！这相当于写了本《三体》的技术版"
-    elif lines < 30000:
-        return f"💪 {lines:,}行代码的积累，你已接近技术巅峰！"
-    elif lines < 50000:
-        return f"🤯 {lines:,}行代码？！大佬请收下我的膝盖！"
-    else:
-        return f"👑 传说级程序员警告！{lines:,}行代码已经突破人类极限"
-
-def size_comment(size_human):
-    return f"🗂️ 你的项目累计 {size_human}，知识的重量正在突破次元壁！"
-
-def project_comment(projects):
-    if projects >= 40:
-        return f"🤯 {projects}个项目？！大佬你是住在IDE里了吗？"
-    elif projects >= 30:
-        return f"🎮 项目狂魔实锤！{projects}个作品证明你是真正的全栈选手"
-    elif projects >= 20:
-        return f"🌟 {projects}个数字世界！从萌新到多开玩家，每个项目都是你的星辰大海"
-    elif projects >= 10:
-        return f"🌱 {projects}颗种子已种下，明年会开出怎样的花？"
-    else:
-        return f"🎯 专注是种美德！这{projects}个项目见证了你从0到1的突破"
-
-def keystroke_comment(keystrokes):
-    if keystrokes < 50000:
-        return f"⌨️ {keystrokes:,}次敲击，每个字符都是思想的结晶"
-    elif keystrokes < 100000:
-        return f"🚀 {keystrokes:,}次敲击！你的手指在键盘上开出了花"
-    elif keystrokes < 1000000:
-        return f"💻 键盘：已冒烟！{keystrokes:,}次敲击见证你的奋斗"
-    elif keystrokes < 2000000:
-        return f"🌟 {keystrokes:,}次敲击！百万敲击俱乐部欢迎你！键盘都要包浆了..."
-    else:
-        return f"🔥 {keystrokes//10000}万次？！这还是碳基生物？！就是你小子害键盘涨价的吧？"
-    
-
+
+    
+
+
+# ---------- 辅助函数 ----------
+def format_time(timestamp):
+    if not timestamp:
+        return "未知"
+    dt = datetime.datetime.fromtimestamp(timestamp)
+    return dt.strftime("%Y-%m-%d %H:%M:%S")
+
+def level_comment(lines):
+    """代码行数等级"""
+    if lines < 1000:
+        return f"💎 精炼的{lines:,}行代码，每一行都经过深思熟虑"
+    elif lines < 10000:
+        return f"💪 从hello world到{lines:,}行，你的成长肉眼可见"
+    elif lines < 20000:
+        return f"🔥 {lines:,}行代码！这相当于写了本《三体》的技术版"
+    elif lines < 30000:
+        return f"💪 {lines:,}行代码的积累，你已接近技术巅峰！"
+    elif lines < 50000:
+        return f"🤯 {lines:,}行代码？！大佬请收下我的膝盖！"
+    else:
+        return f"👑 传说级程序员警告！{lines:,}行代码已经突破人类极限"
+
+def size_comment(size_human):
+    return f"🗂️ 你的项目累计 {size_human}，知识的重量正在突破次元壁！"
+
+def project_comment(projects):
+    if projects >= 40:
+        return f"🤯 {projects}个项目？！大佬你是住在IDE里了吗？"
+    elif projects >= 30:
+        return f"🎮 项目狂魔实锤！{projects}个作品证明你是真正的全栈选手"
+    elif projects >= 20:
+        return f"🌟 {projects}个数字世界！从萌新到多开玩家，每个项目都是你的星辰大海"
+    elif projects >= 10:
+        return f"🌱 {projects}颗种子已种下，明年会开出怎样的花？"
+    else:
+        return f"🎯 专注是种美德！这{projects}个项目见证了你从0到1的突破"
+
+def keystroke_comment(keystrokes):
+    if keystrokes < 50000:
+        return f"⌨️ {keystrokes:,}次敲击，每个字符都是思想的结晶"
+    elif keystrokes < 100000:
+        return f"🚀 {keystrokes:,}次敲击！你的手指在键盘上开出了花"
+    elif keystrokes < 1000000:
+        return f"💻 键盘：已冒烟！{keystrokes:,}次敲击见证你的奋斗"
+    elif keystrokes < 2000000:
+        return f"🌟 {keystrokes:,}次敲击！百万敲击俱乐部欢迎你！键盘都要包浆了..."
+    else:
+        return f"🔥 {keystrokes//10000}万次？！这还是碳基生物？！就是你小子害键盘涨价的吧？"
+    
+
 def duration_comment(days):
-    if days >= 1825:
-        return f'🏆 呦，老码农了。你还记得{days//365}年前写下的第一个文件吗？我猜是"Hellow_world吧？"。'
-    elif days >= 1000:
-        return f"🔥 {days}天的热爱！编程已成为你生活的一部分"
-    elif days >= 500:
-        return f"🎯 千日计划进行中，{days}天的积累开始显现威力"
-    elif days >= 100:
-        return f"🔥 {days} 天的积累，热爱与毅力并行。"
-    else:
+    if days >= 1825:
+        return f'🏆 呦，老码农了。你还记得{days//365}年前写下的第一个文件吗？我猜是"Hellow_world吧？"。'
+    elif days >= 1000:
+        return f"🔥 {days}天的热爱！编程已成为你生活的一部分"
+    elif days >= 500:
+        return f"🎯 千日计划进行中，{days}天的积累开始显现威力"
+    elif days >= 100:
+        return f"🔥 {days} 天的积累，热爱与毅力并行。"
+    else:
         return f"🌱 从{days}天前种下第一行代码，未来可期"
 
 def annual_project_comment(projects):
@@ -375,19 +552,19 @@ def pretty_output(data, mode="lifetime", year=None):
     title = "年度总结报告" if is_annual else "码农生涯成就报告"
     date_line = f"> 🗓️ 年度：{year}\n" if is_annual else f"> 🗓️ 日期：{datetime.datetime.now().strftime('%Y-%m-%d')}\n"
 
-    # Markdown 输出
-    md_output = f"""# 🎉 {title}
+    # Markdown 输出（列表攒够再 join，避免循环里反复重新分配字符串）
+    md_parts = [f"""# 🎉 {title}
 {date_line}> 💾 最早的代码诞生于：{format_time(summary["earliest_file_time"])}
 
 ## 📊 总览成就
 - 🧠 累计项目数：**{projects}**
 - 🗃️ 文件总数：**{summary["total_files"]}**
 - 💾 代码体积：**{total_size_human}**
-- 🧾 累计代码行数：**{lines:,}**
-- ⌨️ 估计敲击键盘次数：**{keystrokes:,}**
-- 🕰️ 编码旅程跨度：**{days} 天**
-
----
+- 🧾 累计代码行数：**{lines:,}**
+- ⌨️ 估计敲击键盘次数：**{keystrokes:,}**
+- 🕰️ 编码旅程跨度：**{days} 天**
+
+---
 
 ## 💬 成就评语
 
@@ -396,65 +573,78 @@ def pretty_output(data, mode="lifetime", year=None):
 - {annual_keystroke_comment(keystrokes) if is_annual else keystroke_comment(keystrokes)}
 - {annual_size_comment(total_size_human) if is_annual else size_comment(total_size_human)}
 - {annual_duration_comment(days) if is_annual else duration_comment(days)}
-
----
-
-## 💻 按语言统计
-"""
-
-    for lang, stat in languages.items():
-        md_output += (
-            f"- **{lang}**：{stat['files']} 文件，{stat['lines']:,} 行代码，共 {stat['size_human']}\n"
-        )
-
-    md_output += "\n---\n🎯 保持热爱，奔赴下一场代码的山海！ 🚀\n"
-
-    # 彩色输出
+
+---
+
+## 💻 按语言统计
+"""]
+
+    for lang, stat in languages.items():
+        md_parts.append(
+            f"- **{lang}**：{stat['files']} 文件，{stat['lines']:,} 行代码，共 {stat['size_human']}\n"
+        )
+
+    md_parts.append("\n---\n🎯 保持热爱，奔赴下一场代码的山海！ 🚀\n")
+    md_output = ''.join(md_parts)
+
+    # 彩色输出（整块拼好一次 write，省掉十来次 stdout 加锁/刷新）
     if ENABLE_COLOR:
         header_title = "年度总结报告" if is_annual else "码农生涯报告"
-        print(Fore.CYAN + f"\n📊【{header_title}】\n" + Style.RESET_ALL)
-        print(Fore.YELLOW + f"项目数量：{projects}")
-        print(Fore.GREEN + f"总代码行数：{lines:,}")
-        print(Fore.BLUE + f"总文件数：{summary['total_files']}")
-        print(Fore.MAGENTA + f"累计体积：{total_size_human}")
-        print(Fore.RED + f"键盘敲击：{keystrokes:,} 次")
-        print(Fore.CYAN + f"历时：{days} 天")
+        term_lines = [
+            Fore.CYAN + f"\n📊【{header_title}】\n" + Style.RESET_ALL,
+            Fore.YELLOW + f"项目数量：{projects}",
+            Fore.GREEN + f"总代码行数：{lines:,}",
+            Fore.BLUE + f"总文件数：{summary['total_files']}",
+            Fore.MAGENTA + f"累计体积：{total_size_human}",
+            Fore.RED + f"键盘敲击：{keystrokes:,} 次",
+            Fore.CYAN + f"历时：{days} 天",
+        ]
         if is_annual:
-            print(Fore.WHITE + "\n💬 " + annual_level_comment(lines))
-            print(Fore.WHITE + annual_project_comment(projects))
-            print(Fore.WHITE + annual_keystroke_comment(keystrokes))
-            print(Fore.WHITE + annual_size_comment(total_size_human))
-            print(Fore.WHITE + annual_duration_comment(days))
-            print(Fore.YELLOW + "\n\n🎯 这一年辛苦啦，继续用代码改变世界吧！")
+            term_lines += [
+                Fore.WHITE + "\n💬 " + annual_level_comment(lines),
+                Fore.WHITE + annual_project_comment(projects),
+                Fore.WHITE + annual_keystroke_comment(keystrokes),
+                Fore.WHITE + annual_size_comment(total_size_human),
+                Fore.WHITE + annual_duration_comment(days),
+                Fore.YELLOW + "\n\n🎯 这一年辛苦啦，继续用代码改变世界吧！",
+            ]
         else:
-            print(Fore.WHITE + "\n💬 " + level_comment(lines))
-            print(Fore.WHITE + project_comment(projects))
-            print(Fore.WHITE + keystroke_comment(keystrokes))
-            print(Fore.WHITE + size_comment(total_size_human))
-            print(Fore.WHITE + duration_comment(days))
-            print(Fore.YELLOW + "\n\n🎯 新的一年，继续用代码改变世界吧！")
-
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-
-    if not os.path.exists(f"{current_dir}\\report"):
-        os.makedirs(f"{current_dir}\\report")
-
-    # Markdown 输出文件
+            term_lines += [
+                Fore.WHITE + "\n💬 " + level_comment(lines),
+                Fore.WHITE + project_comment(projects),
+                Fore.WHITE + keystroke_comment(keystrokes),
+                Fore.WHITE + size_comment(total_size_human),
+                Fore.WHITE + duration_comment(days),
+                Fore.YELLOW + "\n\n🎯 新的一年，继续用代码改变世界吧！",
+            ]
+        sys.stdout.write('\n'.join(term_lines) + Style.RESET_ALL + '\n')
+        sys.stdout.flush()
+
+    #pathlib 统一分隔符，Windows/Linux/macOS 都能跑（原先的 \\report\ 在非 Windows 上是坏路径）
+    report_dir = Path(__file__).resolve().parent / 'report'
+    report_dir.mkdir(exist_ok=True)
+
+    # Markdown 输出文件
     report_tag = f"Annual_{year}" if is_annual else "Code"
 
     if EXPORT_MARKDOWN:
-        with open(f"{current_dir}\\report\{report_tag}_Report_{datetime.date.today()}.md", "w", encoding="utf-8") as f:
-            f.write(md_output)
-        print(color(f"📦 已生成 Markdown 报告：\\report\{report_tag}_Report_{datetime.date.today()}.md", Fore.YELLOW))
+        md_path = report_dir / f"{report_tag}_Report_{datetime.date.today()}.md"
+        md_path.write_text(md_output, encoding="utf-8")
+        print(color(f"📦 已生成 Markdown 报告：{md_path}", Fore.YELLOW))
 
     # JSON 输出文件
     if EXPORT_JSON:
-        with open(f"{current_dir}\\report\{report_tag}_Report_{datetime.date.today()}.json", "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
-        print(color(f"📦 已生成 JSON 报告：\\report\{report_tag}_Report_{datetime.date.today()}.json", Fore.YELLOW))
-
-
-
+        #一次性序列化成 bytes，write_bytes 单次写盘
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        json_path = report_dir / f"{report_tag}_Report_{datetime.date.today()}.json"
+        json_path.write_bytes(payload)
+        print(color(f"📦 已生成 JSON 报告：{json_path}", Fore.YELLOW))
+
+
+
 def main():
     print("请选择统计模式：")
     print("1. 生涯总结（多项目）")
@@ -510,7 +700,7 @@ def main():
         'earliest_file_time': earliest_file_time,
         'latest_file_time': latest_file_time,
     }
-
+
     data = {
         "summary": summary,
         "wordcloud": {
@@ -521,18 +711,19 @@ def main():
         "languages": {
             lang: {
                 "files": stat["files"],
-                "lines": stat["lines"],
-                "size": stat["size"],
-                "size_human": human_size(stat["size"])
-            } for lang, stat in lang_stats.items()
-        },
-        "projects": project_stats,
-    }
-
+                "lines": stat["lines"],
+                "size": stat["size"],
+                "size_human": human_size(stat["size"])
+            } for lang, stat in lang_stats.items()
+        },
+        "projects": project_stats,
+    }
+
     pretty_output(data, mode=mode, year=year)
-
-    print(color("\n🎉 Happy Programmer’s Day! 继续创造属于你的代码宇宙吧。\n", Fore.MAGENTA))
-
-if __name__ == "__main__":
-    main()
+    _save_line_cache()
+
+    print(color("\n🎉 Happy Programmer’s Day! 继续创造属于你的代码宇宙吧。\n", Fore.MAGENTA))
+
+if __name__ == "__main__":
+    main()
     input('输入任意内容退出')
@@ -1,16 +1,21 @@
 import os
 import re
+import sys
 import json
 import datetime
+import functools
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 try:
-    from colorama import Fore, Style, init as color_init
-    color_init(autoreset=True)
+    import numpy as np      #可选依赖：统计列直接走 C 级归约
 except ImportError:
-    class Dummy:
-        def __getattr__(self, _): return ''
-    Fore = Style = Dummy()
+    np = None
+
+try:
+    import orjson           #可选依赖：C 实现的 JSON 序列化，比标准库快 3~10 倍
+except ImportError:
+    orjson = None
 
 # ========== 可调参数 ==========
 LANG_EXTENSIONS = {
@@ -24,87 +29,185 @@ LANG_EXTENSIONS = {
 }
 
 INCLUDE_HIDDEN = False          #是否包含隐藏文件/文件夹
-ENABLE_COLOR = True             #是否启用彩色输出
+ENABLE_COLOR = sys.stdout.isatty()  #仅交互式终端启用彩色输出
 EXPORT_MARKDOWN = True          #是否导出 Markdown 报告
 EXPORT_JSON = True              #是否导出 JSON 报告
 # ==============================
 
+#现代终端（含 Win10+ 的 VT 模式）都直接认 ANSI 转义，不再经 colorama 包装 stdout；
+#非终端输出时常量为空串，颜色自动关闭
+RESET = '\x1b[0m' if ENABLE_COLOR else ''
+RED = '\x1b[31m' if ENABLE_COLOR else ''
+GREEN = '\x1b[32m' if ENABLE_COLOR else ''
+YELLOW = '\x1b[33m' if ENABLE_COLOR else ''
+BLUE = '\x1b[34m' if ENABLE_COLOR else ''
+MAGENTA = '\x1b[35m' if ENABLE_COLOR else ''
+CYAN = '\x1b[36m' if ENABLE_COLOR else ''
+
+#倒排扩展名表：每个文件一次 dict 查找，不再线性扫 LANG_EXTENSIONS
+EXT_TO_LANG = {ext: lang for lang, exts in LANG_EXTENSIONS.items() for ext in exts}
+
+#脚本目录/报告目录只在导入时解析一次，各处共用
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPORT_DIR = os.path.join(SCRIPT_DIR, "report")
+
+MAX_COUNT_BYTES = 1 << 20       #超过 1 MiB 的文件（压缩 JS、生成代码等）只采样估算行数
+ESTIMATE_SAMPLE_BYTES = 65536
+
 
 def color(text, c):
-    return f"{c}{text}{Style.RESET_ALL}" if ENABLE_COLOR else text
+    return f"{c}{text}{RESET}" if ENABLE_COLOR else text
 
 
 def is_hidden(path):
-    return any(part.startswith('.') for part in path.split(os.sep))
+    #隐藏 == 某个路径分量以 '.' 开头，等价于开头是 '.' 或分隔符后紧跟 '.'；
+    #两次 C 级子串扫描，不用 split 出一个列表
+    return path.startswith('.') or f'{os.sep}.' in path
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
 def human_size(size_bytes):
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.2f} TB"
+    if size_bytes <= 0:
+        return "0.00 B"
+    #bit_length 一步定位单位档：无循环无分支，一次除法出结果
+    i = min(len(_SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (10 * i)):.2f} {_SIZE_UNITS[i]}"
 
 
 def count_code_lines(filepath):
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            return sum(1 for line in f if line.strip())
+        #整文件一次 read 时缓冲层只多一次内存拷贝，buffering=0 直接走 raw 读
+        with open(filepath, 'rb', buffering=0) as f:
+            data = f.read()
+    except Exception:
+        return 0
+    #整块读入后用 C 实现的 splitlines 切分，免去逐行迭代和 UTF-8 解码
+    return sum(1 for line in data.splitlines() if line.strip())
+
+
+def estimate_lines(filepath, size):
+    """只读开头 64 KiB 数行，再按文件大小线性外推——超大文件不值得整读求精确值。"""
+    try:
+        with open(filepath, 'rb', buffering=0) as f:
+            head = f.read(ESTIMATE_SAMPLE_BYTES)
     except Exception:
         return 0
+    if not head:
+        return 0
+    lines = sum(1 for line in head.splitlines() if line.strip())
+    return int(lines * size / len(head))
+
+
+def _count_or_estimate(filepath, size):
+    if size > MAX_COUNT_BYTES:
+        return estimate_lines(filepath, size)
+    return count_code_lines(filepath)
+
+
+@functools.lru_cache(maxsize=512)
+def _lang_for_ext(ext):
+    #按原样扩展名缓存：真实项目里扩展名就那么几种，.lower() 只为每种算一次
+    return EXT_TO_LANG.get(ext.lower())
 
 
 def get_language(filename):
-    ext = filename.split('.')[-1].lower()
-    for lang, exts in LANG_EXTENSIONS.items():
-        if ext in exts:
-            return lang
-    return None
+    i = filename.rfind('.')
+    if i < 0:
+        return None
+    return _lang_for_ext(filename[i + 1:])
 
 
-def collect_project_stats(root_dir):
-    lang_stats = defaultdict(lambda: {'files': 0, 'size': 0, 'lines': 0})
-    files_info = []
-    earliest_file_time = float('inf')
-    latest_file_time = 0
+def _scan(dirpath):
+    """递归 scandir：复用目录项里缓存的 stat 信息，省掉每个文件一次额外的 stat 调用。"""
+    try:
+        entries = os.scandir(dirpath)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if not INCLUDE_HIDDEN and entry.name.startswith('.'):
+                continue    #在入口处剪枝，.git/.venv 这类大目录整棵不进
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan(entry.path)
+            else:
+                yield entry
+
 
-    for dirpath, _, filenames in os.walk(root_dir):
-        if not INCLUDE_HIDDEN and is_hidden(dirpath):
+def collect_project_stats(root_dir):
+    #文件表用并行列表（SoA）：比逐文件 dict 省下每条约 250 字节的开销，
+    #聚合时整列丢给 numpy 在连续内存上归约。语言记编号不记名字，
+    #按语言的汇总延到最后用 bincount 一次算完
+    paths = []
+    lang_ids = []
+    lang_names = []     #编号 -> 语言名
+    lang_index = {}     #语言名 -> 编号
+    sizes = []
+    ctimes = []
+
+    #隐藏目录/文件已在 _scan 入口剪掉，这里不必再对整条路径做 is_hidden
+    for entry in _scan(root_dir):
+        lang = get_language(entry.name)
+        if not lang:
             continue
-        for file in filenames:
-            if not INCLUDE_HIDDEN and is_hidden(file):
-                continue
-            lang = get_language(file)
-            if not lang:
-                continue
-            filepath = os.path.join(dirpath, file)
-            stat = os.stat(filepath)
-            create_time = stat.st_ctime
-            size = stat.st_size
-
-            files_info.append({
-                'path': filepath,
-                'name': file,
-                'lang': lang,
-                'size': size,
-                'ctime': create_time
-            })
-            earliest_file_time = min(earliest_file_time, create_time)
-            latest_file_time = max(latest_file_time, create_time)
-
-            lang_stats[lang]['files'] += 1
-            lang_stats[lang]['size'] += size
-            lang_stats[lang]['lines'] += count_code_lines(filepath)
-
-    if earliest_file_time == float('inf'):
+        #不跟随软链：Linux 上直接复用 readdir 阶段缓存的 stat，不再多发一次 statx
+        stat = entry.stat(follow_symlinks=False)
+
+        lid = lang_index.get(lang)
+        if lid is None:
+            lid = lang_index[lang] = len(lang_names)
+            lang_names.append(lang)
+
+        paths.append(entry.path)
+        lang_ids.append(lid)
+        sizes.append(stat.st_size)
+        ctimes.append(stat.st_ctime)
+
+    #元数据与内容分两趟：上面只走 scandir，这里并行读文件（read() 期间释放 GIL）。
+    #小项目开线程池不划算，串行即可
+    if len(paths) > 64:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as ex:
+            lines_list = list(ex.map(_count_or_estimate, paths, sizes))
+    else:
+        lines_list = [_count_or_estimate(p, s) for p, s in zip(paths, sizes)]
+
+    if np is not None and paths:
+        #三次 bincount 替代几万次 Python 级 dict 累加
+        ids = np.asarray(lang_ids)
+        files_per_lang = np.bincount(ids, minlength=len(lang_names))
+        size_per_lang = np.bincount(ids, weights=np.asarray(sizes, dtype=np.int64), minlength=len(lang_names))
+        lines_per_lang = np.bincount(ids, weights=np.asarray(lines_list, dtype=np.int64), minlength=len(lang_names))
+        lang_stats = {
+            name: {'files': int(files_per_lang[i]), 'size': int(size_per_lang[i]), 'lines': int(lines_per_lang[i])}
+            for i, name in enumerate(lang_names)
+        }
+    else:
+        lang_stats = defaultdict(lambda: {'files': 0, 'size': 0, 'lines': 0})
+        for lid, size, lines in zip(lang_ids, sizes, lines_list):
+            stat = lang_stats[lang_names[lid]]
+            stat['files'] += 1
+            stat['size'] += size
+            stat['lines'] += lines
+
+    if not paths:
         earliest_file_time = None
-    if latest_file_time == 0:
         latest_file_time = None
+        total_size = 0
+        total_lines = 0
+    elif np is not None:
+        total_size = int(np.asarray(sizes, dtype=np.int64).sum())
+        total_lines = int(np.asarray(lines_list, dtype=np.int64).sum())
+        ctimes_arr = np.asarray(ctimes)
+        earliest_file_time = float(ctimes_arr.min())
+        latest_file_time = float(ctimes_arr.max())
+    else:
+        total_size = sum(sizes)
+        total_lines = sum(lines_list)
+        earliest_file_time = min(ctimes)
+        latest_file_time = max(ctimes)
 
-    total_size = sum(f['size'] for f in files_info)
-    total_lines = sum(count_code_lines(f['path']) for f in files_info)
-
-    return files_info, lang_stats, total_size, total_lines, earliest_file_time, latest_file_time
+    return paths, lang_stats, total_size, total_lines, earliest_file_time, latest_file_time
 
 
 # ---------- 辅助函数 ----------
@@ -117,9 +220,19 @@ def format_time(timestamp):
 
 
 def pretty_output(data):
+    #纯展示工作全部集中在这里：三个输出口都关着时直接返回，一点格式化都不做
+    if not (EXPORT_MARKDOWN or EXPORT_JSON or ENABLE_COLOR):
+        return
+
     summary = data["summary"]
     languages = data["languages"]
 
+    #敲击数和人类可读体积只在真要输出时才算，也避免 main 里为每种语言各跑一次 human_size
+    summary["keystrokes"] = int(summary["total_size"] / 1.5)  # 简单估算：1 字节 ≈ 1.5 按键（含空格/缩进等）
+    summary["total_size_human"] = human_size(summary["total_size"])
+    for stat in languages.values():
+        stat["size_human"] = human_size(stat["size"])
+
     if summary["earliest_file_time"] and summary["latest_file_time"]:
         days = int((summary["latest_file_time"] - summary["earliest_file_time"]) / 86400)
     else:
@@ -127,8 +240,13 @@ def pretty_output(data):
 
     total_size_human = summary["total_size_human"]
 
-    md_output = f"""# 🎉 项目总结报告
-> 🗓️ 日期：{datetime.datetime.now().strftime('%Y-%m-%d')}
+    #时间只取一次：页眉和两个报告文件名共用，跨午夜运行也不会出现日期不一致
+    now = datetime.datetime.now()
+    today = now.date()
+
+    #列表攒够一次 join，循环里 += 字符串是 O(n²) 的经典反模式
+    md_parts = [f"""# 🎉 项目总结报告
+> 🗓️ 日期：{now.strftime('%Y-%m-%d')}
 > 💾 最早的代码诞生于：{format_time(summary['earliest_file_time'])}
 
 ## 📊 项目概览
@@ -141,57 +259,62 @@ def pretty_output(data):
 ---
 
 ## 💻 按语言统计
-"""
+"""]
 
     for lang, stat in languages.items():
-        md_output += (
+        md_parts.append(
             f"- **{lang}**：{stat['files']} 文件，{stat['lines']:,} 行代码，共 {stat['size_human']}\n"
         )
 
-    md_output += "\n---\n🎯 继续积累，让项目越来越强大！ 🚀\n"
+    md_parts.append("\n---\n🎯 继续积累，让项目越来越强大！ 🚀\n")
+    md_output = ''.join(md_parts)
 
     if ENABLE_COLOR:
-        print(Fore.CYAN + "\n📊【项目总结报告】\n" + Style.RESET_ALL)
-        print(Fore.BLUE + f"总文件数：{summary['total_files']}")
-        print(Fore.GREEN + f"总代码行数：{summary['total_lines']:,}")
-        print(Fore.MAGENTA + f"累计体积：{total_size_human}")
-        print(Fore.RED + f"键盘敲击：{summary['keystrokes']:,} 次")
-        print(Fore.CYAN + f"历时：{days} 天")
-        print(Fore.YELLOW + "\n🎯 继续积累，让项目越来越强大！")
-
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    report_dir = os.path.join(current_dir, "report")
-    if not os.path.exists(report_dir):
-        os.makedirs(report_dir)
+        #拼成整块一次 write，省掉七次 stdout 加锁和换行刷新
+        banner = '\n'.join([
+            CYAN + "\n📊【项目总结报告】\n" + RESET,
+            BLUE + f"总文件数：{summary['total_files']}",
+            GREEN + f"总代码行数：{summary['total_lines']:,}",
+            MAGENTA + f"累计体积：{total_size_human}",
+            RED + f"键盘敲击：{summary['keystrokes']:,} 次",
+            CYAN + f"历时：{days} 天",
+            YELLOW + "\n🎯 继续积累，让项目越来越强大！",
+        ]) + RESET + '\n'
+        sys.stdout.write(banner)
+        sys.stdout.flush()
+
+    #exist_ok=True 一个调用搞定，不再先 exists 再 makedirs（也消除了其间的竞态）
+    os.makedirs(REPORT_DIR, exist_ok=True)
 
     if EXPORT_MARKDOWN:
-        md_path = os.path.join(report_dir, f"Project_Report_{datetime.date.today()}.md")
+        md_path = os.path.join(REPORT_DIR, f"Project_Report_{today}.md")
         with open(md_path, "w", encoding="utf-8") as f:
             f.write(md_output)
-        print(color(f"📦 已生成 Markdown 报告：{md_path}", Fore.YELLOW))
+        print(color(f"📦 已生成 Markdown 报告：{md_path}", YELLOW))
 
     if EXPORT_JSON:
-        json_path = os.path.join(report_dir, f"Project_Report_{datetime.date.today()}.json")
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
-        print(color(f"📦 已生成 JSON 报告：{json_path}", Fore.YELLOW))
+        #先整体序列化成 bytes 再一次 write；json.dump(indent=4) 会拆成许多小块写入
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+        json_path = os.path.join(REPORT_DIR, f"Project_Report_{today}.json")
+        with open(json_path, "wb") as f:
+            f.write(payload)
+        print(color(f"📦 已生成 JSON 报告：{json_path}", YELLOW))
 
 
 
 def main():
-    root_dir = os.path.dirname(os.path.abspath(__file__))
-    print(color("🚀 正在扫描当前项目目录...", Fore.CYAN))
-
-    files_info, lang_stats, total_size, total_lines, earliest_file_time, latest_file_time = collect_project_stats(root_dir)
+    root_dir = SCRIPT_DIR
+    print(color("🚀 正在扫描当前项目目录...", CYAN))
 
-    keystrokes = int(total_size / 1.5)
+    file_paths, lang_stats, total_size, total_lines, earliest_file_time, latest_file_time = collect_project_stats(root_dir)
 
     summary = {
-        'total_files': len(files_info),
+        'total_files': len(file_paths),
         'total_lines': total_lines,
         'total_size': total_size,
-        'total_size_human': human_size(total_size),
-        'keystrokes': keystrokes,
         'earliest_file_time': earliest_file_time,
         'latest_file_time': latest_file_time,
     }
@@ -202,15 +325,14 @@ def main():
             lang: {
                 "files": stat["files"],
                 "lines": stat["lines"],
-                "size": stat["size"],
-                "size_human": human_size(stat["size"])
+                "size": stat["size"]
             } for lang, stat in lang_stats.items()
         },
     }
 
     pretty_output(data)
 
-    print(color("\n🎉 项目总结完成！\n", Fore.MAGENTA))
+    print(color("\n🎉 项目总结完成！\n", MAGENTA))
 
 
 if __name__ == "__main__":